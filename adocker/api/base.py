@@ -1,10 +1,10 @@
 import aiodocker
+import aiohttp
 
-
-from adocker.api.image import ImageApiMixin
+from .image import ImageApiMixin
 from .transitional import AioDockerTransitionalDeprecationMixin
 from .utils import ApiUtilitiesMixin
-from ..utils.streamed_response import StreamableResponse
+from ..utils.streamed_response import DEFAULT_READ_BUFSIZE, StreamableResponse
 
 
 class APIClient(
@@ -13,12 +13,20 @@ class APIClient(
         ApiUtilitiesMixin,
         ImageApiMixin):
 
+    #: The size of aiohttp's read buffer for streamed responses.
+    stream_read_buffer_size = DEFAULT_READ_BUFSIZE
+
     def _json_stream(self, url, **kwargs) -> StreamableResponse:
-        # `timeout` has to be set to 0, otherwise after 5 minutes the client
-        # will close the connection
+        # The overall timeout has to be disabled, otherwise after 5 minutes
+        # the client will close the connection. Connecting to the daemon is
+        # still limited so a dead socket fails in finite time.
         # http://aiohttp.readthedocs.io/en/stable/client_reference.html#aiohttp.ClientSession.request
-        kwargs.update(timeout=0)
-        return StreamableResponse(self._query(
-            url,
-            **kwargs
-        ))
+        if hasattr(aiohttp, 'ClientTimeout'):
+            kwargs.setdefault('timeout', aiohttp.ClientTimeout(
+                total=None, sock_connect=30, sock_read=None))
+        else:
+            kwargs.setdefault('timeout', 0)
+        return StreamableResponse(
+            self._query(url, **kwargs),
+            read_bufsize=self.stream_read_buffer_size,
+        )
@@ -1,7 +1,30 @@
+import sys
 import warnings
 
 from ..errors import AioDockerDeprecationWarning
 
+# Deprecation warnings are not issued when running with ``-O``, leaving the
+# deprecated properties as cheap as the ones they forward to.
+_WARN_DEPRECATED = __debug__
+
+# The call sites which have already been warned about reading ``.docker_host``.
+_warned_docker_host_sites = set()
+
+
+def _warn_docker_host(message: str):
+    """
+    Warn about reading ``.docker_host``; once for each calling line.
+
+    ``aiodocker`` reads ``.docker_host`` every time a URL is built, so issuing
+    the warning every time would be costly. Setting it is rare, so that is
+    warned about every time.
+    """
+    caller = sys._getframe(2)
+    site = (caller.f_code, caller.f_lineno, message)
+    if site not in _warned_docker_host_sites:
+        _warned_docker_host_sites.add(site)
+        warnings.warn(message, AioDockerDeprecationWarning, stacklevel=3)
+
 
 class AioDockerTransitionalDeprecationMixin(object):
     @property
@@ -9,9 +32,9 @@ class AioDockerTransitionalDeprecationMixin(object):
         """
         This property is deprecated. Please use ``.base_url``.
         """
-        warnings.warn(
-            "Accessing `.docker_host` is deprecated. Use `.base_url`",
-            AioDockerDeprecationWarning)
+        if _WARN_DEPRECATED:
+            _warn_docker_host(
+                "Accessing `.docker_host` is deprecated. Use `.base_url`")
         return self.base_url
 
     @docker_host.setter
@@ -19,8 +42,10 @@ class AioDockerTransitionalDeprecationMixin(object):
         """
         This property is deprecated. Please use ``.base_url``.
         """
-        warnings.warn("Setting `.docker_host` is deprecated. Use `.base_url`",
-                      AioDockerDeprecationWarning)
+        if _WARN_DEPRECATED:
+            warnings.warn(
+                "Setting `.docker_host` is deprecated. Use `.base_url`",
+                AioDockerDeprecationWarning, stacklevel=2)
         self.base_url = value
 
     @property
@@ -40,9 +65,11 @@ class AioDockerTransitionalDeprecationMixin(object):
     @api_version.setter
     def api_version(self, version: str):
         if version[0] == 'v':
-            warnings.warn(
-                'Setting `.api_version` a "v..." string is deprecated.'
-                ' Remove the "v" prefix.',
-                AioDockerDeprecationWarning)
+            if _WARN_DEPRECATED:
+                warnings.warn(
+                    'Setting `.api_version` a "v..." string is deprecated.'
+                    ' Remove the "v" prefix.',
+                    AioDockerDeprecationWarning)
             version = version[1:]
         self._api_version = version
+        self._versioned_url_prefix = None
@@ -1,29 +1,82 @@
 import functools
-import urllib.parse
+import string
 
-PATH_QUOTE = functools.partial(urllib.parse.quote_plus, safe="/:")
+#: Characters which are never quoted, plus the ``safe`` characters ``/:``.
+_UNQUOTED = frozenset(string.ascii_letters + string.digits + '_.-~' + '/:')
+
+#: The quoted form of every byte value, as produced by
+#: ``urllib.parse.quote_plus(value, safe="/:")`` on Python 3.7 and newer.
+_QUOTE_TABLE = tuple(
+    '+' if b == 0x20 else chr(b) if chr(b) in _UNQUOTED else '%{:02X}'.format(b)
+    for b in range(256)
+)
+
+
+def _fast_quote(value: str, _table=_QUOTE_TABLE) -> str:
+    """
+    Quote ``value`` for use in a URL path using a byte lookup table.
+    """
+    return ''.join([_table[b] for b in value.encode('utf-8')])
+
+
+PATH_QUOTE = _fast_quote
+
+
+@functools.lru_cache(maxsize=256)
+def _format_path(pathfmt: str, args: tuple, _quote=PATH_QUOTE) -> str:
+    """
+    Format ``pathfmt`` with the URL quoted ``args``.
+
+    The same paths are usually requested repeatedly, so results are cached.
+    """
+    return pathfmt.format(*[_quote(arg) for arg in args])
+
+
+def _raise_arg_type(args):
+    """
+    Raise a :class:`ValueError` for the first argument which is not a string.
+    """
+    # Coppied from docker-py
+    for idx, arg in enumerate(args):
+        if not isinstance(arg, str):
+            raise ValueError(
+                'Expected a string but found {0} ({1}) at {2} '
+                'instead'.format(arg, type(arg), idx)
+            )
 
 
 class ApiUtilitiesMixin(object):
 
+    # The versioned URL prefix; ``None`` when it needs to be recomputed.
+    _versioned_url_prefix = None
+
+    @property
+    def base_url(self) -> str:
+        """
+        The URL of the Docker daemon.
+        """
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str):
+        self._base_url = value
+        self._versioned_url_prefix = None
+
     def _format_url(self, pathfmt, *args: str, versioned_api: bool=True) -> str:
         """
         Generate a URL by formatting ``pathfmt`` with URL-safe ``args``
 
         Returns a versioned URL if ``versioned_api`` is ``True``.
         """
-        # Coppied from docker-py
-        for idx, arg in enumerate(args):
-            if not isinstance(arg, str):
-                raise ValueError(
-                    'Expected a string but found {0} ({1}) at {2} '
-                    'instead'.format(arg, type(arg), idx)
-                )
-
-        args = map(PATH_QUOTE, args)
+        # Argument checking is skipped when running with ``python -O``.
+        if __debug__ and not all(isinstance(arg, str) for arg in args):
+            _raise_arg_type(args)
+        path = _format_path(pathfmt, args)
         if versioned_api:
-            return '{0}/v{1}{2}'.format(
-                self.base_url, self.api_version, pathfmt.format(*args)
-            )
+            prefix = self._versioned_url_prefix
+            if prefix is None:
+                prefix = self._versioned_url_prefix = '{0}/v{1}'.format(
+                    self.base_url, self.api_version)
+            return prefix + path
         else:
-            return '{0}{1}'.format(self.base_url, pathfmt.format(*args))
+            return self.base_url + path
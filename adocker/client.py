@@ -1,9 +1,46 @@
+import asyncio
+
 import docker.constants
 import docker.utils
 
+from adocker.api import APIClient
 from adocker.utils.contextlib import AsyncContextManager
 from adocker.utils.streamed_response import StreamableResponse
-from adocker.utis.aiodocker_ext import APIClient
+
+#: API clients shared between :class:`DockerClient` instances. Maps the
+#: arguments used to construct the client to a list of the client and the
+#: number of :class:`DockerClient` instances using it.
+_client_cache = {}
+
+# Replaces a :class:`DockerClient`'s cache key once it has released its shared
+# client, so that exiting it again does not release the client twice.
+_RELEASED = object()
+
+
+def _acquire_api_client(key, url, **kwargs) -> APIClient:
+    """
+    Return the shared :class:`APIClient` for ``key``, creating it if needed.
+
+    Every call must be paired with a call to :func:`_release_api_client`.
+    """
+    entry = _client_cache.get(key)
+    if entry is None:
+        entry = _client_cache[key] = [APIClient(url=url, **kwargs), 0]
+    entry[1] += 1
+    return entry[0]
+
+
+async def _release_api_client(key, exc_type=None, exc=None, tb=None):
+    """
+    Release a client from :func:`_acquire_api_client`.
+
+    The client is closed once it is no longer in use.
+    """
+    entry = _client_cache[key]
+    entry[1] -= 1
+    if entry[1] == 0:
+        del _client_cache[key]
+        await entry[0].__aexit__(exc_type, exc, tb)
 
 
 class DockerClient(AsyncContextManager):
@@ -36,8 +73,28 @@ class DockerClient(AsyncContextManager):
             **kwargs
         )
 
-    def __init__(self, url, **kwargs):
-        self.api = APIClient(url=url, **kwargs)
+    def __init__(self, url, *, share=True, **kwargs):
+        """
+        Create a client connecting to the Docker daemon at ``url``.
+
+        If ``share`` is ``True`` then the underlying :class:`APIClient`, and
+        its connection pool, is shared with other clients created with the
+        same arguments on the same event loop.
+        """
+        self._cache_key = None
+        if share:
+            key = (asyncio.get_event_loop(), url, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                # Unhashable arguments; fall back to a private client.
+                pass
+            else:
+                self._cache_key = key
+        if self._cache_key is None:
+            self.api = APIClient(url=url, **kwargs)
+        else:
+            self.api = _acquire_api_client(self._cache_key, url, **kwargs)
 
     # TODO: Handlers for images, containers ect.
 
@@ -49,4 +106,9 @@ class DockerClient(AsyncContextManager):
         )
 
     async def __aexit__(self, exc_type, exc, tb):
-        await self.client.__aexit__(exc_type, exc, tb)
+        key = self._cache_key
+        if key is None:
+            await self.api.__aexit__(exc_type, exc, tb)
+        elif key is not _RELEASED:
+            self._cache_key = _RELEASED
+            await _release_api_client(key, exc_type, exc, tb)
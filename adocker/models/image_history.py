@@ -4,6 +4,7 @@ from .resource import attribute_value, Model
 from ..utils.utils import as_aware_datetime
 
 class ImageParent(Model):
+    __slots__ = ()
 
     created = attribute_value('Created', type=int)
     created_date = attribute_value('Created', type=datetime.datetime, convert=as_aware_datetime)
@@ -1,32 +1,65 @@
+import sys
 import typing as typ
 
 _sentinal = object()
 
 
+class _AttributeValue(object):
+    """
+    A non-data descriptor exposing a converted value from ``attrs``.
+
+    The converted value is stored in the instance's ``__dict__`` on first
+    access; this shadows the descriptor so later reads are a plain attribute
+    lookup. :meth:`Model._clear_attribute_cache` drops these stored values
+    when ``attrs`` is replaced.
+    """
+
+    def __init__(self, attr_key, default, convert, doc):
+        self.attr_key = attr_key
+        self.default = default
+        self.convert = convert
+        self.name = None
+        self.__doc__ = doc
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        owner._cached_attrs = getattr(owner, '_cached_attrs', ()) + (name,)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if self.default is _sentinal:
+            value = self.convert(instance.attrs[self.attr_key])
+        else:
+            value = self.convert(instance.attrs.get(self.attr_key, self.default))
+        if self.name is not None:
+            instance.__dict__[self.name] = value
+        return value
+
+
 def attribute_value(attr_key, *, default=_sentinal, type=typ.Any, convert=lambda x: x):
     docs = """The value of {0!r} from the attributes.""".format(attr_key)
-    if default == _sentinal:
-        def getter(self) -> type:
-            return convert(self.attrs[attr_key])
+    if default is _sentinal:
         docs += """
         .. raises::
             KeyError: If {0!r} is missing from this instance's attributes.
         """.format(attr_key)
-    else:
-        def getter(self) -> type:
-            return convert(self.attrs.get(attr_key, default))
-    return property(
-        fget=getter,
-        doc=docs
-    )
+    return _AttributeValue(attr_key, default, convert, docs)
 
 
 class Model(object):
     """
     A base class for representing a single object on the server.
     """
+    # ``__dict__`` is kept for the values cached by :func:`attribute_value`;
+    # it is only allocated once one of those is read.
+    __slots__ = ('client', 'collection', '_attrs', '_id', '_hash', '__dict__')
+
     id_attribute = 'Id'
 
+    #: The names of the :func:`attribute_value` descriptors on this class.
+    _cached_attrs = ()
+
     def __init__(self, attrs=None, client=None, collection=None):
         #: A client pointing at the server that this object is on.
         self.client = client
@@ -34,36 +67,69 @@ class Model(object):
         #: The collection that this model is part of.
         self.collection = collection
 
-        #: The raw representation of this object from the API
-        self.attrs = attrs
-        if self.attrs is None:
-            self.attrs = {}
+        # Nothing can have been cached yet, so only the identity is computed.
+        self._attrs = {} if attrs is None else attrs
+        self._cache_identity()
+
+    @property
+    def attrs(self):
+        """
+        The raw representation of this object from the API.
+        """
+        return self._attrs
+
+    @attrs.setter
+    def attrs(self, attrs):
+        self._attrs = {} if attrs is None else attrs
+        self._cache_identity()
+        self._clear_attribute_cache()
+
+    def _cache_identity(self):
+        """
+        Store the ID and hash of this object, as computed from ``attrs``.
+        """
+        self._id = self._attrs.get(self.id_attribute)
+        if isinstance(self._id, str):
+            # IDs are shared by many models; interning lets comparisons
+            # short-circuit on identity.
+            self._id = sys.intern(self._id)
+        self._hash = hash((self.__class__.__name__, self._id))
+
+    def _clear_attribute_cache(self):
+        """
+        Forget any values cached by :func:`attribute_value` descriptors.
+        """
+        instance_dict = self.__dict__
+        for name in self._cached_attrs:
+            instance_dict.pop(name, None)
 
     def __repr__(self):
         return "<%s: %s>" % (self.__class__.__name__, self.short_id)
 
     def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.id == other.id
+        return isinstance(other, self.__class__) and self._id == other._id
 
     def __hash__(self):
-        return hash("%s:%s" % (self.__class__.__name__, self.id))
+        return self._hash
 
     @property
     def id(self):
         """
         The ID of the object.
         """
-        return self.attrs.get(self.id_attribute)
+        return self._id
 
     @property
     def short_id(self):
         """
         The ID of the object, truncated to 10 characters.
         """
-        return self.id[:10]
+        return self._id[:10]
 
 
 class ReloadableModel(Model):
+    __slots__ = ()
+
     async def reload(self):
         """
         Load this object from the server again and update ``attrs`` with the
@@ -1,3 +1,5 @@
+import codecs
+import collections
 import collections.abc
 import json
 import typing as typ
@@ -5,38 +7,105 @@ import typing as typ
 import aiohttp
 import docker.utils.json_stream as stream_utils
 
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:  # pragma: no cover - Optional dependency
+    _orjson_loads = None
+
 from .contextlib import AsyncContextManager
 from ..errors import ChunkedStreamingError
 
 T = typ.TypeVar('T')
-SplitterReturn = typ.Optional[typ.Tuple[T, typ.Text]]
+SplitterReturn = typ.Optional[typ.Tuple[T, int]]
+
+#: Returned by ``try_next`` at the end of a stream.
+END = object()
+
+_skip_whitespace = json.decoder.WHITESPACE.match
+
+# Decoders hold no per-stream state, so streams using the default decoder all
+# share this one rather than constructing their own.
+_default_json_decoder = json.JSONDecoder()
 
 
 class ChunkedBytesStream(collections.abc.AsyncIterator, AsyncContextManager):
-    def __init__(self, response: aiohttp.ClientResponse):
+    """
+    An asynchronous iterator over blocks of bytes from the response.
+
+    Each block is at least ``min_chunk_size`` bytes, except at the end of the
+    stream. When ``flush_on_http_chunk`` is ``True`` a block is also returned
+    as soon as the end of a HTTP chunk is read; this keeps latency low for
+    streams of small, infrequent messages.
+    """
+
+    __slots__ = ('response', 'min_chunk_size', 'flush_on_http_chunk')
+
+    def __init__(self,
+                 response: aiohttp.ClientResponse,
+                 *,
+                 min_chunk_size: int = 128 * 1024,
+                 flush_on_http_chunk: bool = False):
         self.response = response
+        self.min_chunk_size = min_chunk_size
+        self.flush_on_http_chunk = flush_on_http_chunk
 
     async def __aenter__(self):
         await self.response.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
+        # The response discards any unread content when it is released.
         await self.response.__aexit__(exc_type, exc, tb)
-        async for unused in self:  # noqa: F841 - Unused variable
+
+    async def drain(self):
+        """
+        Read and discard the remainder of the response.
+        """
+        async for unused in self.response.content.iter_any():  # noqa: F841
             pass
 
     async def __anext__(self):
-        if self.response.at_eof():
-            await self.response.close()
+        item = await self.try_next()
+        if item is END:
             raise StopAsyncIteration
+        return item
+
+    async def try_next(self):
+        """
+        Return the next item, or :data:`END` at the end of the stream.
+
+        This avoids raising :class:`StopAsyncIteration` for callers that loop
+        over the stream themselves.
+        """
+        buffer = await self._read_chunk()
+        if buffer is None:
+            return END
+        return bytes(buffer)
+
+    async def _read_chunk(self) -> typ.Optional[bytearray]:
+        """
+        Read the next block of data from the response, or return ``None`` at
+        the end of the stream.
+        """
+        content = self.response.content
+        if content.at_eof():
+            # Reading from a closed response raises, so check before reading.
+            self.response.close()
+            return None
+        buffer = bytearray()
         try:
-            chunk_complete = False
-            buffer = b''
-            while not chunk_complete:
-                data, chunk_complete = await self.response.content.readchunk()
-                buffer += data
+            async for data, chunk_complete in content.iter_chunks():
+                buffer.extend(data)
+                if len(buffer) >= self.min_chunk_size:
+                    break
+                if chunk_complete and self.flush_on_http_chunk and buffer:
+                    break
         except aiohttp.ClientPayloadError as e:
             raise ChunkedStreamingError() from e
+        if not buffer:
+            # The content ended without any more data.
+            self.response.close()
+            return None
         return buffer
 
     async def complete(self):
@@ -48,12 +117,30 @@ class ChunkedBytesStream(collections.abc.AsyncIterator, AsyncContextManager):
 
 
 class ChunkedStream(ChunkedBytesStream):
-    async def __anext__(self):
-        return bytes.decode(
-            await super().__anext__(),
+    """
+    An asynchronous iterator over blocks of text from the response.
+
+    Characters split across blocks are decoded correctly.
+    """
+
+    __slots__ = ('_text_decoder',)
+
+    def __init__(self, *a, **k):
+        super().__init__(*a, **k)
+        decoder_cls = codecs.getincrementaldecoder(
             # Charset can sometimes be none in which case default to utf-8.
-            encoding=self.response.charset or 'utf-8',
-            errors='replace')
+            self.response.charset or 'utf-8')
+        self._text_decoder = decoder_cls(errors='replace')
+
+    async def try_next(self):
+        buffer = await self._read_chunk()
+        if buffer is None:
+            # Flush out any incomplete character at the end of the stream.
+            remainder = self._text_decoder.decode(b'', final=True)
+            if remainder:
+                return remainder
+            return END
+        return self._text_decoder.decode(buffer)
 
 
 class SplitStream(ChunkedStream):
@@ -61,19 +148,53 @@ class SplitStream(ChunkedStream):
     An asynchronous iterator over subsets of the stream.
     """
 
-    def __init__(self, *a, **k):
-        super().__init__(*a, **k)
-        self._buffer = ''
+    __slots__ = ('_chunks', '_scan_from')
+
+    def __init__(self, *a, flush_on_http_chunk: bool = True, **k):
+        super().__init__(*a, flush_on_http_chunk=flush_on_http_chunk, **k)
+        # Chunks received from the response which are yet to be split. These
+        # are only joined when the splitter needs to see them as one string.
+        self._chunks = collections.deque()
+        # The index in the first chunk at which the next item starts.
+        self._scan_from = 0
+
+    def _buffer(self) -> typ.Text:
+        """
+        Join the pending chunks into a single string and return it.
+        """
+        chunks = self._chunks
+        if not chunks:
+            return ''
+        if len(chunks) > 1:
+            # Drop the already split prefix whilst joining.
+            chunks[0] = chunks[0][self._scan_from:]
+            self._scan_from = 0
+            buffer = ''.join(chunks)
+            chunks.clear()
+            chunks.append(buffer)
+        return chunks[0]
+
+    def _append_text(self, text: typ.Text) -> None:
+        """
+        Add ``text`` to the end of the buffer.
+        """
+        # An empty chunk would still make :meth:`_buffer` join, and so copy,
+        # the whole buffer.
+        if text:
+            self._chunks.append(text)
 
-    def splitter(self, buffer: typ.Text) -> typ.Optional[SplitterReturn]:
+    def splitter(self, buffer: typ.Text, start: int = 0) -> typ.Optional[SplitterReturn]:
         """
         Convert a portion of the buffer into the final object and return it.
 
+        Parsing should begin at index ``start`` of ``buffer``.
+
         .. returns::
-            A 2-tuple of the parsed object, and the unused buffer.
+            A 2-tuple of the parsed object, and the index in ``buffer`` at
+            which the unused data starts.
         """
-        if buffer:
-            return buffer[:-2], buffer[-2:]
+        if len(buffer) - start > 2:
+            return buffer[start:-2], len(buffer) - 2
         else:
             return None
 
@@ -87,49 +208,192 @@ class SplitStream(ChunkedStream):
         """
         return buffer
 
-    async def __anext__(self):
+    def _split_all(self, limit: typ.Optional[int] = None) -> typ.List[T]:
+        """
+        Split every complete item out of the buffer, or at most ``limit``
+        items when it is given.
+        """
+        items = []
+        buffer = self._buffer()
+        while limit is None or len(items) < limit:
+            buffer_split = self.splitter(buffer, self._scan_from)
+            if buffer_split is None:
+                return items
+            item, self._scan_from = buffer_split
+            items.append(item)
+        return items
+
+    def _decode_remainder(self) -> T:
+        """
+        Decode what is left in the buffer at the end of the stream.
+
+        Returns :data:`END` if the buffer is empty.
+        """
+        buffer = self._buffer()[self._scan_from:]
+        if not buffer:
+            return END
+        self._chunks.clear()
+        self._scan_from = 0
+        try:
+            return self.decoder(buffer)
+        except Exception as e:
+            raise ChunkedStreamingError() from e
+
+    def feed_data(self, data: bytes,
+                  limit: typ.Optional[int] = None) -> typ.List[T]:
+        """
+        Add ``data`` read directly from the response and return the items
+        completed by it.
+
+        This allows reading the response in large blocks rather than one
+        item at a time. :meth:`feed_eof` must be called once all the data has
+        been read.
+
+        When ``limit`` is given at most that many items are returned; the
+        rest of the data is left in the buffer, unparsed, for later calls.
+        """
+        self._append_text(self._text_decoder.decode(data))
+        return self._split_all(limit)
+
+    def feed_eof(self, limit: typ.Optional[int] = None) -> typ.List[T]:
+        """
+        Indicate the end of the data given to :meth:`feed_data` and return
+        the remaining items, or at most ``limit`` of them.
+        """
+        self._append_text(self._text_decoder.decode(b'', final=True))
+        items = self._split_all(limit)
+        if limit is None or len(items) < limit:
+            item = self._decode_remainder()
+            if item is not END:
+                items.append(item)
+        return items
+
+    async def try_next(self):
         end_of_stream = False
         while True:
-            buffer_split = self.splitter(self._buffer)
+            buffer = self._buffer()
+            buffer_split = self.splitter(buffer, self._scan_from)
             if buffer_split is not None:
-                item, new_buffer = buffer_split
-                self._buffer = new_buffer
+                item, self._scan_from = buffer_split
                 return item
             elif buffer_split is None and end_of_stream:
-                if self._buffer:
-                    self._buffer, tmp_buf = '', self._buffer
-                    try:
-                        return self.decoder(tmp_buf)
-                    except Exception as e:
-                        raise ChunkedStreamingError() from e
-                raise StopAsyncIteration
-            try:
-                self._buffer += await super().__anext__()
-            except StopAsyncIteration:
+                return self._decode_remainder()
+            chunk = await super().try_next()
+            if chunk is END:
                 end_of_stream = True
+            else:
+                self._append_text(chunk)
 
 
 class JsonStream(SplitStream):
+    """
+    An asynchronous iterator over the JSON objects in the stream.
+
+    When ``orjson`` is installed and the default ``decoder_cls`` is used, each
+    newline terminated object is decoded with ``orjson``; anything it rejects
+    falls back to ``decoder_cls``. UTF-8 data given to :meth:`feed_data` is
+    decoded by ``orjson`` without first being converted to text.
+    """
+
+    __slots__ = ('_decoder', '_raw_decode', '_fast_loads', '_fast_loads_bytes')
+
     def __init__(self,
                  *a,
                  decoder_cls: typ.Type[json.JSONDecoder] = json.JSONDecoder,
                  **k):
         super().__init__(*a, **k)
-        self._decoder = decoder_cls()
+        if decoder_cls is json.JSONDecoder:
+            self._decoder = _default_json_decoder
+        else:
+            self._decoder = decoder_cls()
+        # Bound once here to save the attribute lookups for every object.
+        self._raw_decode = self._decoder.raw_decode
+        if _orjson_loads is not None and decoder_cls is json.JSONDecoder:
+            self._fast_loads = _orjson_loads
+        else:
+            self._fast_loads = None
+        self._fast_loads_bytes = None
+        if self._fast_loads is not None and codecs.lookup(
+                self.response.charset or 'utf-8').name == 'utf-8':
+            self._fast_loads_bytes = self._fast_loads
+
+    def feed_data(
+            self, data: bytes, limit: typ.Optional[int] = None
+    ) -> typ.List[typ.Dict[str, typ.Any]]:
+        loads = self._fast_loads_bytes
+        if loads is None:
+            return super().feed_data(data, limit)
+        if self._text_decoder.getstate()[0] or len(self._buffer()) > self._scan_from:
+            # The start of ``data`` continues a partial object from earlier
+            # data.
+            return super().feed_data(data, limit)
+        if limit is None:
+            lines = data.split(b'\n')
+            tail = lines.pop()
+            try:
+                # Splitting and decoding every line runs in C without a
+                # Python-level loop.
+                items = list(map(loads, lines))
+            except ValueError:
+                # A line is blank or not a complete object; take it line by
+                # line.
+                pass
+            else:
+                items.extend(super().feed_data(tail))
+                return items
+        items = []
+        start = 0
+        end = data.find(b'\n')
+        # Lines are handed to ``loads`` as views into ``data`` rather than as
+        # copies. With a ``limit`` the lines after the last item wanted are
+        # not decoded at all.
+        with memoryview(data) as view:
+            while end != -1 and (limit is None or len(items) < limit):
+                if end > start:
+                    try:
+                        items.append(loads(view[start:end]))
+                    except ValueError:
+                        if not data[start:end].isspace():
+                            # Leave this line for the general purpose decoder.
+                            break
+                start = end + 1
+                end = data.find(b'\n', start)
+        if limit is not None:
+            limit -= len(items)
+        items.extend(super().feed_data(data[start:], limit))
+        return items
 
     def splitter(
-            self, buffer: typ.Text
-    ) -> typ.Optional[typ.Tuple[typ.Dict[str, typ.Any], typ.Text]]:
+            self, buffer: typ.Text, start: int = 0
+    ) -> typ.Optional[typ.Tuple[typ.Dict[str, typ.Any], int]]:
         """
         Decode the partial JSON object and return it.
         """
-        buffer = buffer.strip()
+        # Whitespace is skipped by index rather than by copying the buffer.
+        start = _skip_whitespace(buffer, start).end()
+        fast_loads = self._fast_loads
+        if fast_loads is not None:
+            # Docker emits one object per line, so try decoding the whole line.
+            end = buffer.find('\n', start)
+            if end != -1:
+                try:
+                    obj = fast_loads(buffer[start:end])
+                except ValueError:
+                    pass
+                else:
+                    return obj, _skip_whitespace(buffer, end).end()
         try:
-            obj, index = self._decoder.raw_decode(buffer)
-            rest = buffer[json.decoder.WHITESPACE.match(buffer, index).end():]
-            return obj, rest
+            obj, end = self._raw_decode(buffer, start)
         except ValueError:
             return None
+        return obj, _skip_whitespace(buffer, end).end()
+
+    def _decode_remainder(self) -> typ.Dict[str, typ.Any]:
+        # Whitespace after the last object may only arrive once that object
+        # has been split out.
+        buffer = self._buffer()
+        self._scan_from = _skip_whitespace(buffer, self._scan_from).end()
+        return super()._decode_remainder()
 
     def decoder(self, buffer: typ.Text) -> typ.Dict[str, typ.Any]:
         return self._decoder.decode(buffer)
@@ -27,12 +27,14 @@ the Python code is released under the following license:
 """
 
 import abc
+import asyncio
 import collections
-import inspect
 import sys
 
 
 class AsyncContextManager(metaclass=abc.ABCMeta):
+    __slots__ = ()
+
     async def __aenter__(self):
         return self
 
@@ -75,7 +77,7 @@ class AsyncExitStack(AsyncContextManager):
             return cm_exit(cm, *exc_details)
 
         _exit_wrapper.__self__ = cm
-        self.push(_exit_wrapper)
+        self._push_exit_callback(_exit_wrapper)
 
     def _push_cm_aexit(self, cm, cm_aexit):
         """Helper to correctly register callbacks to __aexit__ methods"""
@@ -84,7 +86,11 @@ class AsyncExitStack(AsyncContextManager):
             return await cm_aexit(cm, *exc_details)
 
         _exit_wrapper.__self__ = cm
-        self.push(_exit_wrapper)
+        self._push_exit_callback(_exit_wrapper, True)
+
+    def _push_exit_callback(self, callback, is_async=False):
+        """Helper to register a callback along with whether to await it"""
+        self._exit_callbacks.append((is_async, callback))
 
     def push(self, exit):
         """Registers a callback with the standard __exit__ method signature
@@ -95,8 +101,8 @@ class AsyncExitStack(AsyncContextManager):
         Note: This looks for exit methods in the following order:
         ``exit.__aexit__``, ``exit.__exit__``, ``exit``. It will also handle
         the case where ``exit`` is an asynchronous
-        function(:func:`inspect.isawaitable` returns ``True``) by awaiting it
-        during exiting.
+        function(:func:`asyncio.iscoroutinefunction` returns ``True``) by
+        awaiting it during exiting.
         """
         # We use an unbound method rather than a bound method to follow
         # the standard lookup behaviour for special methods
@@ -108,7 +114,8 @@ class AsyncExitStack(AsyncContextManager):
                 exit_method = _cb_type.__exit__
             except AttributeError:
                 # Not a context manager, so assume its a callable
-                self._exit_callbacks.append(exit)
+                self._push_exit_callback(
+                    exit, asyncio.iscoroutinefunction(exit))
             else:
                 self._push_cm_exit(exit, exit_method)
         else:
@@ -119,11 +126,12 @@ class AsyncExitStack(AsyncContextManager):
         """Registers an arbitrary callback and arguments.
         Cannot suppress exceptions.
 
-        If ``callback`` is an awaitable function(:func:`inspect.isawaitable`
-        returns ``True``), then the the function will be awaited on in the
-        ``__aexit__`` method.
+        If ``callback`` is an asynchronous
+        function(:func:`asyncio.iscoroutinefunction` returns ``True``), then
+        the the function will be awaited on in the ``__aexit__`` method.
         """
-        if inspect.isawaitable(callback):
+        is_async = asyncio.iscoroutinefunction(callback)
+        if is_async:
             async def _exit_wrapper(exc_type, exc, tb):
                 await callback(*args, **kwds)
         else:
@@ -134,7 +142,7 @@ class AsyncExitStack(AsyncContextManager):
         # We changed the signature, so using @wraps is not appropriate, but
         # setting __wrapped__ may still help with introspection
         _exit_wrapper.__wrapped__ = callback
-        self.push(_exit_wrapper)
+        self._push_exit_callback(_exit_wrapper, is_async)
         return callback  # Allow use as a decorator
 
     def enter_context(self, cm):
@@ -174,7 +182,9 @@ class AsyncExitStack(AsyncContextManager):
         frame_exc = sys.exc_info()[1]
 
         def _fix_exception_context(new_exc, old_exc):
-            # Context may not be correct, so find the end of the chain
+            # Context may not be correct, so find the end of the chain. The
+            # IDs of visited exceptions are tracked so a cyclic chain ends.
+            seen = {id(new_exc)}
             while 1:
                 exc_context = new_exc.__context__
                 if exc_context is old_exc:
@@ -182,6 +192,9 @@ class AsyncExitStack(AsyncContextManager):
                     return
                 if exc_context is None or exc_context is frame_exc:
                     break
+                if id(exc_context) in seen:
+                    break
+                seen.add(id(exc_context))
                 new_exc = exc_context
             # Change the end of the chain to point to the exception
             # we expect it to reference
@@ -192,9 +205,9 @@ class AsyncExitStack(AsyncContextManager):
         suppressed_exc = False
         pending_raise = False
         while self._exit_callbacks:
-            cb = self._exit_callbacks.pop()
+            is_async, cb = self._exit_callbacks.pop()
             try:
-                if inspect.isawaitable(cb):
+                if is_async:
                     result = await cb(*exc_details)
                 else:
                     result = cb(*exc_details)
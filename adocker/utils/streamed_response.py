@@ -1,16 +1,25 @@
-import collections.abc as abc
+import asyncio
 import typing as typ
 
 import aiohttp
 
-from .chunked_stream import ChunkedBytesStream, JsonStream
+from .chunked_stream import ChunkedBytesStream, END, JsonStream, SplitStream
 from .contextlib import AsyncContextManager
+from ..errors import ChunkedStreamingError
 
 StreamType = typ.TypeVar('StreamType', ChunkedBytesStream, JsonStream)
 
+#: The default size of aiohttp's read buffer for streamed responses. aiohttp's
+#: own 64KiB default stalls fast streams, such as ``stats``, whenever the
+#: buffer fills.
+DEFAULT_READ_BUFSIZE = 4 * 1024 * 1024
 
-class StreamableResponse(typ.Generic[StreamType], abc.Awaitable,
-                         abc.AsyncIterator, AsyncContextManager):
+#: The default number of bytes read from the response at once when reading it
+#: in bulk. Much smaller reads cost more in per-call overhead than they save.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class StreamableResponse(typ.Generic[StreamType], AsyncContextManager):
     """
     A Response to a method that streams blocks of data.
 
@@ -24,37 +33,72 @@ class StreamableResponse(typ.Generic[StreamType], abc.Awaitable,
         data is streamed.
     """
 
+    __slots__ = ('pending_response', 'stream_class', 'read_bufsize',
+                 'chunk_size', 'response', 'stream', '_ready_future')
+
     def __init__(self,
                  pending_response: typ.Awaitable[aiohttp.ClientResponse],
-                 stream_class: typ.Type[StreamType] = JsonStream):
+                 stream_class: typ.Type[StreamType] = JsonStream,
+                 *,
+                 read_bufsize: int = DEFAULT_READ_BUFSIZE,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
         self.pending_response = pending_response
         self.stream_class = stream_class
+        self.read_bufsize = read_bufsize
+        #: The number of bytes read from the response at once by
+        #: :meth:`as_list`.
+        self.chunk_size = chunk_size
         self.response = None
         self.stream = None
+        self._ready_future = None
 
     async def ready(self) -> None:
         """
         Waits for the response headers to be ready.
 
+        Internally this is only awaited when ``self.response`` is ``None``, to
+        avoid creating a coroutine for every item once the response is ready.
+
         .. warning::
             This method *does not* check the response status code or headers.
         """
         if self.response is None:
-            response = await self.pending_response
-            # Second check necessary in the event multiple calls to ready are
-            # running at once.
-            if self.response is None:
-                self.response = response
-                self.stream = JsonStream(response)
+            # Concurrent callers all wait on the one task, as the pending
+            # response can only be awaited once. The task is shielded so that
+            # cancelling one caller doesn't cancel it for the others.
+            if self._ready_future is None:
+                self._ready_future = asyncio.ensure_future(
+                    self._receive_response())
+            await asyncio.shield(self._ready_future)
         # TODO: (not in this function) Check response headers.
 
+    async def _receive_response(self) -> None:
+        response = await self.pending_response
+        self._apply_read_bufsize(response)
+        self.response = response
+        self.stream = self.stream_class(response)
+
+    def _apply_read_bufsize(self, response: aiohttp.ClientResponse) -> None:
+        """
+        Enlarge the response's read buffer to at least ``read_bufsize``.
+        """
+        # The request is made before this object sees it, so aiohttp's
+        # ``read_bufsize`` argument cannot be used; adjust the reader's limits
+        # directly instead.
+        content = response.content
+        if hasattr(content, '_high_water'):
+            content._low_water = max(content._low_water, self.read_bufsize)
+            content._high_water = max(
+                content._high_water, 2 * self.read_bufsize)
+
     async def get_response(self) -> aiohttp.ClientResponse:
         """
         Wait for the response headers to be ready and then return the response.
 
         This is the same response as used internally for iteration.
         """
-        await self.ready()
+        if self.response is None:
+            await self.ready()
         return self.response
 
     async def get_stream(self) -> StreamType:
@@ -63,13 +107,38 @@ class StreamableResponse(typ.Generic[StreamType], abc.Awaitable,
 
         This is the same stream as used internally for iteration.
         """
-        await self.ready()
+        if self.response is None:
+            await self.ready()
         return self.stream
 
-    async def complete(self):
-        async with self:
-            for unused in self:
-                pass
+    async def _read_content(self) -> bytes:
+        """
+        Read up to ``chunk_size`` bytes from the response.
+
+        Returns ``b''`` once all the content has been read.
+        """
+        content = self.response.content
+        if content.at_eof():
+            # Iterating closes the response at the end of the stream, and
+            # reading from a closed response raises.
+            return b''
+        try:
+            return await content.read(self.chunk_size)
+        except aiohttp.ClientPayloadError as e:
+            raise ChunkedStreamingError() from e
+
+    async def complete(self) -> None:
+        """
+        Wait for the stream to finish, discarding any remaining items.
+
+        The remaining content is read without being decoded, and the response
+        is then released.
+        """
+        if self.response is None:
+            await self.ready()
+        while await self._read_content():
+            pass
+        await self.response.release()
 
     async def as_list(self, n: typ.Optional[int] = None):
         """
@@ -83,30 +152,68 @@ class StreamableResponse(typ.Generic[StreamType], abc.Awaitable,
         Note that this element will not exit if this oject represents an
         infinite stream.
         """
+        if self.response is None:
+            await self.ready()
+        if isinstance(self.stream, SplitStream):
+            # Read the response in large blocks and split them in bulk rather
+            # than awaiting each item. Items left over from an earlier call
+            # are split out first, so no read is made if they are enough.
+            stream = self.stream
+            results = stream.feed_data(b'', n)
+            while n is None or len(results) < n:
+                remaining = None if n is None else n - len(results)
+                data = await self._read_content()
+                if not data:
+                    results.extend(stream.feed_eof(remaining))
+                    break
+                results.extend(stream.feed_data(data, remaining))
+            return results
+
         results = []
-        stream = self.__aiter__()
-        while True:
-            if n is not None and len(results) >= n:
-                return results
-            try:
-                item = await stream.__anext__()
-            except StopAsyncIteration:
-                return results
+        stream = self.stream
+        while n is None or len(results) < n:
+            item = await stream.try_next()
+            if item is END:
+                break
             results.append(item)
+        return results
 
-    async def __await__(self):
+    def __aiter__(self):
+        return self
+
+    def __await__(self):
+        return self._await_all().__await__()
+
+    async def _await_all(self):
         async with self:
-            return self.as_list()
+            return await self.as_list()
 
     async def __aenter__(self):
-        await self.ready()
+        if self.response is None:
+            await self.ready()
         await self.response.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        await self.ready()
+        if self.response is None:
+            await self.ready()
         await self.response.__aexit__(exc_type, exc, tb)
 
     async def __anext__(self):
-        await self.ready()
-        return self.stream.__anext__()
+        if self.response is None:
+            await self.ready()
+        return await self.stream.__anext__()
+
+
+async def ready_all(*responses: StreamableResponse) -> None:
+    """
+    Wait for the headers of all the given responses to be ready.
+
+    The responses are waited on concurrently rather than one at a time, so
+    fanning out many streams (for example ``stats`` for every container)
+    takes about as long as the slowest request.
+    """
+    pending = [response.ready() for response in responses
+               if response.response is None]
+    if pending:
+        await asyncio.gather(*pending)
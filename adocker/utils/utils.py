@@ -1,5 +1,36 @@
 import datetime as dt
+import re
 
+_UTC = dt.timezone.utc
 
-def as_aware_datetime(utc_timestamp):
-    return dt. datetime.fromtimestamp(utc_timestamp, dt.timezone.utc)
+# Python versions before 3.11 only parse exactly 3 or 6 fractional digits in
+# `fromisoformat` and do not accept a ``Z`` suffix. Docker gives up to 9
+# digits, with trailing zeros removed.
+_FRACTION = re.compile(r'\.(\d+)')
+
+
+def _six_digit_fraction(match):
+    return '.' + match.group(1)[:6].ljust(6, '0')
+
+
+def as_aware_datetime(value):
+    """
+    Convert a timestamp from the Docker API into an aware datetime.
+
+    ``value`` is either a UNIX timestamp or an RFC 3339 formatted string.
+
+    .. note::
+        Parsing strings requires Python 3.7 or newer.
+    """
+    if isinstance(value, str):
+        try:
+            parsed = dt.datetime.fromisoformat(value)
+        except ValueError:
+            if value.endswith('Z'):
+                value = value[:-1] + '+00:00'
+            parsed = dt.datetime.fromisoformat(
+                _FRACTION.sub(_six_digit_fraction, value))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=_UTC)
+        return parsed
+    return dt.datetime.fromtimestamp(value, _UTC)
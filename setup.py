@@ -4,6 +4,16 @@
 """The setup script."""
 
 from setuptools import find_packages, setup
+from setuptools.command.build_ext import build_ext
+
+try:
+    from setuptools.errors import CCompilerError, ExecError, PlatformError
+except ImportError:  # setuptools before 59
+    from distutils.errors import (
+        CCompilerError,
+        DistutilsExecError as ExecError,
+        DistutilsPlatformError as PlatformError,
+    )
 
 with open('README.rst') as readme_file:
     readme = readme_file.read()
@@ -27,6 +37,54 @@ cov_requirements = [
     'coverage',
 ]
 
+fast_requirements = [
+    'orjson',
+]
+
+# The streaming modules are compiled when Cython is installed before building;
+# otherwise, or if compiling fails, they are installed as plain Python.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize([
+        'adocker/utils/chunked_stream.py',
+        'adocker/utils/streamed_response.py',
+    ], language_level=3, compiler_directives={
+        # The annotations are hints for readers, not exact types to enforce.
+        'annotation_typing': False,
+    })
+
+
+class optional_build_ext(build_ext):
+    """
+    Build the extensions, falling back to plain Python if they can't be built.
+    """
+
+    build_errors = (CCompilerError, ExecError, PlatformError, OSError)
+
+    def run(self):
+        try:
+            super().run()
+        except self.build_errors as e:
+            self.warn('Not compiling extensions: {}'.format(e))
+            self.extensions = []
+
+    def build_extensions(self):
+        self.check_extensions_list(self.extensions)
+        built = []
+        for ext in self.extensions:
+            try:
+                self.build_extension(ext)
+            except self.build_errors as e:
+                self.warn('Not compiling {}: {}'.format(ext.name, e))
+            else:
+                built.append(ext)
+        # Only the extensions which were built are copied or installed.
+        self.extensions = built
+
+
 lint_equirements = [
     'flake8',
 ]
@@ -41,11 +99,14 @@ setup(
     url='https://github.com/leesdolphin/adocker',
     packages=find_packages(include=['adocker', 'adocker.*']),
     include_package_data=True,
+    ext_modules=ext_modules,
+    cmdclass={'build_ext': optional_build_ext},
     install_requires=requirements,
     tests_require=test_requirements,
     extras_require={
         'test': test_requirements,
         'cov': cov_requirements,
+        'fast': fast_requirements,
     },
     license="Apache Software License 2.0",
     test_suite='tests',
@@ -2,7 +2,54 @@ import pytest
 
 import adocker.api.base as a_base
 import adocker.api.transitional as a_transitional
+import adocker.api.utils as a_utils
 import adocker.errors as a_errors
 
 
 # _format_url
+
+async def test_format_url_versioned(adocker_api):
+    adocker_api.api_version = '1.27'
+    url = adocker_api._format_url('/images/{}/json', 'my image:latest')
+    assert url == adocker_api.base_url + '/v1.27/images/my+image:latest/json'
+
+
+async def test_format_url_unversioned(adocker_api):
+    url = adocker_api._format_url('/_ping', versioned_api=False)
+    assert url == adocker_api.base_url + '/_ping'
+
+
+async def test_format_url_follows_changes(adocker_api):
+    adocker_api.api_version = '1.27'
+    adocker_api._format_url('/info')
+    adocker_api.api_version = '1.30'
+    adocker_api.base_url = 'http://localhost:2375'
+    assert adocker_api._format_url('/info') == 'http://localhost:2375/v1.30/info'
+
+
+async def test_format_url_rejects_non_string_args(adocker_api):
+    with pytest.raises(ValueError, match=r'Expected a string .* at 1 instead'):
+        adocker_api._format_url('/{}/{}', 'image', 123)
+
+
+# PATH_QUOTE
+
+# Literal values, as `quote_plus` only stopped quoting ``~`` in Python 3.7.
+@pytest.mark.parametrize('value,expected', [
+    ('', ''),
+    ('ubuntu', 'ubuntu'),
+    ('ubuntu:16.04', 'ubuntu:16.04'),
+    ('localhost:5000/my/image', 'localhost:5000/my/image'),
+    ('sha256:abcdef0123456789', 'sha256:abcdef0123456789'),
+    ('a b+c&d=e?f#g%h', 'a+b%2Bc%26d%3De%3Ff%23g%25h'),
+    ('~_.-', '~_.-'),
+    ('üñíçødé ✓', '%C3%BC%C3%B1%C3%AD%C3%A7%C3%B8d%C3%A9+%E2%9C%93'),
+    (''.join(chr(c) for c in range(128)),
+     '%00%01%02%03%04%05%06%07%08%09%0A%0B%0C%0D%0E%0F'
+     '%10%11%12%13%14%15%16%17%18%19%1A%1B%1C%1D%1E%1F'
+     '+%21%22%23%24%25%26%27%28%29%2A%2B%2C-./0123456789:%3B%3C%3D%3E%3F'
+     '%40ABCDEFGHIJKLMNOPQRSTUVWXYZ%5B%5C%5D%5E_'
+     '%60abcdefghijklmnopqrstuvwxyz%7B%7C%7D~%7F'),
+])
+def test_path_quote(value, expected):
+    assert a_utils.PATH_QUOTE(value) == expected
@@ -6,8 +6,17 @@ import adocker.api as a_api
 import adocker.errors as a_errors
 
 
-@pytest.fixture()
-def adocker_api(request, event_loop):
+@pytest.fixture(scope='session')
+def event_loop():
+    # One loop for the whole session; creating and closing a loop for every
+    # test dominates the run time of the quicker tests.
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope='module')
+def shared_adocker_api(request, event_loop):
     asyncio.set_event_loop(event_loop)
     with pytest.warns(a_errors.AioDockerDeprecationWarning):
         api = a_api.APIClient()
@@ -16,3 +25,18 @@ def adocker_api(request, event_loop):
         event_loop.run_until_complete(api.close())
     request.addfinalizer(cleanup)
     return api
+
+
+@pytest.fixture()
+def adocker_api(request, shared_adocker_api):
+    # The client is shared by the tests in a module, so undo any changes each
+    # test makes to it.
+    api = shared_adocker_api
+    base_url = api.base_url
+    api_version = api.api_version
+
+    def restore():
+        api.base_url = base_url
+        api.api_version = api_version
+    request.addfinalizer(restore)
+    return api
@@ -0,0 +1,34 @@
+import adocker.models.resources as a_resources
+
+
+class Thing(a_resources.Model):
+    name = a_resources.attribute_value('Name')
+    size = a_resources.attribute_value('Size', default=0, convert=int)
+
+
+def test_attribute_value():
+    thing = Thing(attrs={'Id': 'abc', 'Name': 'thing', 'Size': '12'})
+    assert thing.name == 'thing'
+    assert thing.size == 12
+    assert Thing().size == 0
+
+
+def test_setting_attrs_updates_model():
+    thing = Thing(attrs={'Id': 'abc', 'Name': 'thing'})
+    assert thing.id == 'abc'
+    assert thing.name == 'thing'
+    old_hash = hash(thing)
+
+    thing.attrs = {'Id': 'def', 'Name': 'other', 'Size': 5}
+    assert thing.id == 'def'
+    assert thing.name == 'other'
+    assert thing.size == 5
+    assert hash(thing) != old_hash
+    assert thing == Thing(attrs={'Id': 'def'})
+
+
+def test_setting_attrs_to_none():
+    thing = Thing(attrs={'Id': 'abc'})
+    thing.attrs = None
+    assert thing.attrs == {}
+    assert thing.id is None
@@ -0,0 +1,53 @@
+import pytest
+
+import adocker.client as a_client
+import adocker.errors as a_errors
+
+URL = 'tcp://127.0.0.1:2375'
+
+
+def new_client(*args, **kwargs):
+    # Creating an `APIClient` warns about aiodocker setting `.docker_host`.
+    with pytest.warns(a_errors.AioDockerDeprecationWarning):
+        return a_client.DockerClient(*args, **kwargs)
+
+
+async def test_clients_share_api():
+    first = new_client(URL)
+    second = a_client.DockerClient(URL)
+    assert first.api is second.api
+    api = first.api
+
+    await first.__aexit__(None, None, None)
+    assert not api.session.closed
+    # Exiting again must not release the client a second time.
+    await first.__aexit__(None, None, None)
+    assert not api.session.closed
+
+    await second.__aexit__(None, None, None)
+    assert api.session.closed
+    assert not a_client._client_cache
+
+
+async def test_clients_with_different_arguments_do_not_share_api():
+    first = new_client(URL)
+    second = new_client('tcp://127.0.0.1:2376')
+    try:
+        assert first.api is not second.api
+    finally:
+        await first.__aexit__(None, None, None)
+        await second.__aexit__(None, None, None)
+    assert not a_client._client_cache
+
+
+async def test_client_without_share():
+    shared = new_client(URL)
+    private = new_client(URL, share=False)
+    try:
+        assert private.api is not shared.api
+        await private.__aexit__(None, None, None)
+        assert private.api.session.closed
+        assert not shared.api.session.closed
+    finally:
+        await shared.__aexit__(None, None, None)
+    assert not a_client._client_cache
@@ -0,0 +1,39 @@
+import adocker.utils.contextlib as a_contextlib
+
+
+class AsyncRecorder(a_contextlib.AsyncContextManager):
+
+    def __init__(self, calls, name):
+        self.calls = calls
+        self.name = name
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.calls.append(self.name)
+
+
+async def test_exit_stack_awaits_async_callbacks():
+    calls = []
+
+    async def async_callback(name):
+        calls.append(name)
+
+    async def async_exit(exc_type, exc, tb):
+        calls.append('push')
+
+    async with a_contextlib.AsyncExitStack() as stack:
+        stack.callback(calls.append, 'sync')
+        stack.callback(async_callback, 'async')
+        stack.push(async_exit)
+        await stack.enter_async_context(AsyncRecorder(calls, 'context'))
+    # Callbacks run in reverse order, and coroutines are awaited rather than
+    # left un-run.
+    assert calls == ['context', 'push', 'async', 'sync']
+
+
+async def test_exit_stack_async_exit_suppresses():
+    async def suppress(exc_type, exc, tb):
+        return True
+
+    async with a_contextlib.AsyncExitStack() as stack:
+        stack.push(suppress)
+        raise ValueError()
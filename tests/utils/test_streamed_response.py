@@ -0,0 +1,236 @@
+import asyncio
+import functools
+import json
+
+import aiohttp
+import aiohttp.web
+import pytest
+
+import adocker.errors as a_errors
+import adocker.utils.chunked_stream as a_chunked_stream
+import adocker.utils.streamed_response as a_streamed_response
+
+OBJECTS = [{'id': i, 'status': 'é✓' * i} for i in range(50)]
+NDJSON = ''.join(
+    json.dumps(obj, ensure_ascii=False) + '\n' for obj in OBJECTS
+).encode('utf-8')
+
+LARGE_OBJECTS = [{'id': i} for i in range(2000)]
+LARGE_NDJSON = ''.join(
+    json.dumps(obj) + '\n' for obj in LARGE_OBJECTS).encode('utf-8')
+
+
+async def ndjson_handler(request):
+    response = aiohttp.web.StreamResponse()
+    response.content_type = 'application/json'
+    response.enable_chunked_encoding()
+    await response.prepare(request)
+    # Small writes, so that objects and characters are split across HTTP
+    # chunks.
+    for i in range(0, len(NDJSON), 7):
+        await response.write(NDJSON[i:i + 7])
+    await response.write_eof()
+    return response
+
+
+async def split_character_handler(request):
+    response = aiohttp.web.StreamResponse()
+    response.enable_chunked_encoding()
+    await response.prepare(request)
+    # Send each character in two halves, with a delay so that each half is
+    # read on its own.
+    for data in 'é✓'.encode('utf-8'):
+        await response.write(bytes([data]))
+        await asyncio.sleep(0.01)
+    await response.write_eof()
+    return response
+
+
+async def large_handler(request):
+    return aiohttp.web.Response(body=LARGE_NDJSON)
+
+
+async def blank_handler(request):
+    return aiohttp.web.Response(body=b'\n')
+
+
+async def truncated_handler(request):
+    response = aiohttp.web.StreamResponse()
+    response.enable_chunked_encoding()
+    await response.prepare(request)
+    await response.write(NDJSON[:100])
+    # Drop the connection part way through the response.
+    request.transport.close()
+    return response
+
+
+@pytest.fixture()
+async def server(aiohttp_server):
+    app = aiohttp.web.Application()
+    app.router.add_get('/ndjson', ndjson_handler)
+    app.router.add_get('/split', split_character_handler)
+    app.router.add_get('/large', large_handler)
+    app.router.add_get('/blank', blank_handler)
+    app.router.add_get('/truncated', truncated_handler)
+    return await aiohttp_server(app)
+
+
+@pytest.fixture()
+def ndjson_url(server):
+    return server.make_url('/ndjson')
+
+
+@pytest.fixture()
+def blank_url(server):
+    return server.make_url('/blank')
+
+
+@pytest.fixture()
+def truncated_url(server):
+    return server.make_url('/truncated')
+
+
+@pytest.fixture()
+async def session():
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+
+def streamed(session, url, *args, **kwargs):
+    return a_streamed_response.StreamableResponse(
+        session.get(url), *args, **kwargs)
+
+
+async def test_async_for(session, ndjson_url):
+    items = []
+    async with streamed(session, ndjson_url) as response:
+        async for item in response:
+            items.append(item)
+    assert items == OBJECTS
+
+
+async def test_async_for_bytes(session, ndjson_url):
+    blocks = []
+    async with streamed(session, ndjson_url,
+                        a_chunked_stream.ChunkedBytesStream) as response:
+        async for block in response:
+            assert block
+            blocks.append(block)
+    assert b''.join(blocks) == NDJSON
+
+
+async def test_as_list_bytes(session, ndjson_url):
+    async with streamed(session, ndjson_url,
+                        a_chunked_stream.ChunkedBytesStream) as response:
+        assert b''.join(await response.as_list()) == NDJSON
+        assert await response.as_list() == []
+
+
+async def test_as_list_after_iterating(session, ndjson_url):
+    items = []
+    async with streamed(session, ndjson_url) as response:
+        async for item in response:
+            items.append(item)
+        assert await response.as_list() == []
+    assert items == OBJECTS
+
+
+async def test_as_list_after_blank_response(session, blank_url):
+    async with streamed(session, blank_url) as response:
+        with pytest.raises(StopAsyncIteration):
+            await response.__anext__()
+        assert await response.as_list() == []
+
+
+async def test_as_list_truncated(session, truncated_url):
+    async with streamed(session, truncated_url) as response:
+        with pytest.raises(a_errors.ChunkedStreamingError):
+            await response.as_list()
+
+
+async def test_complete_after_iterating(session, ndjson_url):
+    items = []
+    async with streamed(session, ndjson_url) as response:
+        async for item in response:
+            items.append(item)
+        await response.complete()
+    assert items == OBJECTS
+
+
+async def test_complete_truncated(session, truncated_url):
+    async with streamed(session, truncated_url) as response:
+        with pytest.raises(a_errors.ChunkedStreamingError):
+            await response.complete()
+
+
+async def test_await(session, ndjson_url):
+    assert await streamed(session, ndjson_url) == OBJECTS
+
+
+async def test_anext(session, ndjson_url):
+    async with streamed(session, ndjson_url) as response:
+        assert await response.__anext__() == OBJECTS[0]
+        assert await response.__anext__() == OBJECTS[1]
+
+
+async def test_as_list_n(session, ndjson_url):
+    async with streamed(session, ndjson_url) as response:
+        assert await response.as_list(5) == OBJECTS[:5]
+        assert await response.as_list(0) == []
+        # Items parsed past the fifth are kept for later calls.
+        assert await response.as_list(1) == OBJECTS[5:6]
+        assert await response.as_list() == OBJECTS[6:]
+        assert await response.as_list(1) == []
+
+
+async def test_as_list_n_then_iterate(session, ndjson_url):
+    async with streamed(session, ndjson_url) as response:
+        items = await response.as_list(3)
+        async for item in response:
+            items.append(item)
+    assert items == OBJECTS
+
+
+async def test_concurrent_ready(session, ndjson_url):
+    async with streamed(session, ndjson_url) as response:
+        # The request can only be awaited once; concurrent callers share it.
+        streams = await asyncio.gather(
+            response.get_stream(), response.get_stream(), response.ready())
+        assert streams[0] is streams[1] is response.stream
+        assert await response.as_list() == OBJECTS
+
+
+async def test_ready_all(session, ndjson_url):
+    responses = [streamed(session, ndjson_url) for _ in range(3)]
+    await a_streamed_response.ready_all(*responses)
+    assert all(response.response is not None for response in responses)
+    for response in responses:
+        async with response:
+            assert await response.as_list() == OBJECTS
+
+
+async def test_split_characters(session, server):
+    stream_class = functools.partial(
+        a_chunked_stream.ChunkedStream, min_chunk_size=1)
+    async with streamed(session, server.make_url('/split'),
+                        stream_class) as response:
+        assert ''.join(await response.as_list()) == 'é✓'
+
+
+async def test_as_list_one_at_a_time(session, server):
+    async with streamed(session, server.make_url('/large')) as response:
+        content = (await response.get_response()).content
+        while not content.is_eof():
+            # Wait for the whole body, so that it is read as one block.
+            await asyncio.sleep(0.01)
+        items = await response.as_list(1)
+        buffer = response.stream._buffer()
+        while True:
+            batch = await response.as_list(1)
+            if not batch:
+                break
+            items.extend(batch)
+            # The rest of the block is split where it is, rather than copied
+            # by every call.
+            assert response.stream._buffer() is buffer
+    assert items == LARGE_OBJECTS
@@ -0,0 +1,28 @@
+import datetime as dt
+
+import pytest
+
+import adocker.utils.utils as a_utils
+
+UTC = dt.timezone.utc
+
+
+@pytest.mark.parametrize('value,expected', [
+    (1496953794, dt.datetime(2017, 6, 8, 20, 29, 54, tzinfo=UTC)),
+    (1496953794.5, dt.datetime(2017, 6, 8, 20, 29, 54, 500000, tzinfo=UTC)),
+    ('2017-06-08T20:29:54Z', dt.datetime(2017, 6, 8, 20, 29, 54, tzinfo=UTC)),
+    ('2017-06-08T20:29:54.123456789Z',
+     dt.datetime(2017, 6, 8, 20, 29, 54, 123456, tzinfo=UTC)),
+    ('2017-06-08T20:29:54.12345Z',
+     dt.datetime(2017, 6, 8, 20, 29, 54, 123450, tzinfo=UTC)),
+    ('2017-06-08T20:29:54.1Z',
+     dt.datetime(2017, 6, 8, 20, 29, 54, 100000, tzinfo=UTC)),
+    ('2017-06-08T20:29:54.1+10:00',
+     dt.datetime(2017, 6, 8, 20, 29, 54, 100000,
+                 tzinfo=dt.timezone(dt.timedelta(hours=10)))),
+    ('2017-06-08T20:29:54', dt.datetime(2017, 6, 8, 20, 29, 54, tzinfo=UTC)),
+])
+def test_as_aware_datetime(value, expected):
+    parsed = a_utils.as_aware_datetime(value)
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()